@@ -10,3 +10,5 @@ CONST_LOG2 = flint.arb.const_log2()
 CONST_EULER = flint.arb.const_euler()
 PACKING_BOUND = 2**16
 MATRIX_SWITCH = 249  # TODO: determine this number during build via tests
+MATRIX_NUMPY_SWITCH = 64
+STRASSEN_CUTOFF = 16
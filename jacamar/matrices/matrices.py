@@ -15,11 +15,238 @@ AUTHORS:
 import flint
 import numpy as np
 
-from jacamar.rings.integers import ZZ, ZZ_py
-from jacamar.rings.reals import RR, RR_py
-from jacamar.rings.complexes import CC
-from jacamar.rings.rationals import QQ
-from jacamar.constants import MATRIX_SWITCH
+from jacamar.rings.integers import ZZ, ZZ_py, Integer
+from jacamar.rings.reals import RR, RR_py, RealNumber
+from jacamar.rings.complexes import CC, ComplexNumber
+from jacamar.rings.rationals import QQ, Rational
+from jacamar.constants import MATRIX_NUMPY_SWITCH, MATRIX_SWITCH, STRASSEN_CUTOFF
+
+# Element classes by which a matrix may be multiplied as a scalar.
+_SCALAR_TYPES = (RealNumber, ComplexNumber, Integer, Rational)
+
+# Storage kind by base ring; any ring not listed here is generic.
+_RING_KIND = {
+    ZZ: "flint",
+    QQ: "flint",
+    RR: "flint",
+    CC: "flint",
+    ZZ_py: "python",
+    RR_py: "python",
+}
+
+# FLINT matrix classes by base ring. Each is called as (nrows, ncols) for a
+# zero matrix, or as (nrows, ncols, entries) with a flat row-major list.
+_MAT_CONSTRUCTORS = {
+    ZZ: flint.fmpz_mat,
+    QQ: flint.fmpq_mat,
+    RR: flint.arb_mat,
+    CC: flint.acb_mat,
+}
+
+# FLINT base rings in order of promotion: mixing two of them gives a result
+# over the later one.
+_FLINT_RINGS = (ZZ, QQ, RR, CC)
+
+# Entry data types forming integral domains in which `//` divides exactly, as
+# fraction-free elimination requires.
+_BAREISS_DATA_TYPES = (flint.fmpz_mpoly, flint.fmpq_mpoly)
+
+
+def _partition(A, k):
+    """
+    Returns the `k` by `k` grid of blocks of the array `A`, as a list of rows
+    of views into `A`. Block boundaries are spread as evenly as possible.
+    """
+    rs = [i * A.shape[0] // k for i in range(k + 1)]
+    cs = [j * A.shape[1] // k for j in range(k + 1)]
+    return [
+        [A[rs[i] : rs[i + 1], cs[j] : cs[j + 1]] for j in range(k)] for i in range(k)
+    ]
+
+
+def _strassen_workspace(n, cutoff=STRASSEN_CUTOFF):
+    """
+    Returns the scratch space used by `_strassen` on blocks of size `n`: one
+    object array of shape `(9, m, m)` for each recursion level with blocks of
+    size `m`. It holds the two operand sums and the seven products of a level.
+    """
+    work = []
+    while n > cutoff:
+        n //= 2
+        work.append(np.empty((9, n, n), dtype=object))
+    return work
+
+
+def _strassen(A, B, cutoff=STRASSEN_CUTOFF, out=None, work=None, level=0):
+    """
+    Returns the product of the square object arrays `A` and `B` of the same
+    size using Strassen's algorithm. The recursion stops at blocks of size at
+    most `cutoff`, which are multiplied by NumPy directly. Blocks of odd size
+    are handled by dynamic peeling: Strassen runs on the leading even block
+    and the last row and column are fixed up by ordinary products.
+
+    The product is written into `out` when it is given. Intermediate sums and
+    products are written into `work[level]`, from `_strassen_workspace`, so
+    that no level allocates arrays of its own.
+    """
+    n = A.shape[0]
+    if out is None:
+        out = np.empty((n, n), dtype=object)
+    if n <= cutoff:
+        np.matmul(A, B, out=out)
+        return out
+    if work is None:
+        work = _strassen_workspace(n, cutoff)
+
+    # Dynamic peeling
+    if n % 2 == 1:
+        m = n - 1
+        C = out[:m, :m]
+        _strassen(A[:m, :m], B[:m, :m], cutoff, C, work, level)
+        np.add(C, np.multiply.outer(A[:m, m], B[m, :m]), out=C)
+        np.matmul(A[:m], B[:, m], out=out[:m, m])
+        np.matmul(A[m], B, out=out[m])
+        return out
+
+    # Partitions (views, not copies)
+    (A11, A12), (A21, A22) = _partition(A, 2)
+    (B11, B12), (B21, B22) = _partition(B, 2)
+    (C11, C12), (C21, C22) = _partition(out, 2)
+    S, T, P1, P2, P3, P4, P5, P6, P7 = work[level]
+
+    # Recursions
+    def product(X, Y, P):
+        _strassen(X, Y, cutoff, P, work, level + 1)
+
+    product(A11, np.subtract(B12, B22, out=T), P1)
+    product(np.add(A11, A12, out=S), B22, P2)
+    product(np.add(A21, A22, out=S), B11, P3)
+    product(A22, np.subtract(B21, B11, out=T), P4)
+    product(np.add(A11, A22, out=S), np.add(B11, B22, out=T), P5)
+    product(np.subtract(A12, A22, out=S), np.add(B21, B22, out=T), P6)
+    product(np.subtract(A11, A21, out=S), np.add(B11, B12, out=T), P7)
+
+    # Combine results to form C
+    np.add(P5, P4, out=C11)
+    np.subtract(C11, P2, out=C11)
+    np.add(C11, P6, out=C11)
+    np.add(P1, P2, out=C12)
+    np.add(P3, P4, out=C21)
+    np.add(P5, P1, out=C22)
+    np.subtract(C22, P3, out=C22)
+    np.subtract(C22, P7, out=C22)
+    return out
+
+
+def _slice(r, c, nrows, ncols):
+    """
+    Returns `(r, c, nrows, ncols)` for the submatrix of a matrix of size
+    `(nrows, ncols)` selected by the row and column indices `r` and `c`. Each
+    index may be an int or a slice; both are returned as slices, alongside the
+    size of the submatrix. An int index out of range raises IndexError.
+    """
+    if not isinstance(r, slice):
+        r = _index_slice(r, nrows)
+    if not isinstance(c, slice):
+        c = _index_slice(c, ncols)
+    return r, c, len(range(*r.indices(nrows))), len(range(*c.indices(ncols)))
+
+
+def _index(i, n):
+    """
+    Returns the index `i` of a length `n` axis as a nonnegative int. Negative
+    indices count from the end; an index out of range raises IndexError.
+    """
+    if not -n <= i < n:
+        raise IndexError(f"Index {i} is out of range for size {n}.")
+    if i < 0:
+        i += n
+    return i
+
+
+def _index_slice(i, n):
+    """Returns the one-wide slice selecting index `i` of a length `n` axis."""
+    i = _index(i, n)
+    return slice(i, i + 1)
+
+
+def _bareiss_determinant(entries):
+    """
+    Returns the determinant of the square list-of-lists `entries`, with at
+    least two rows, by Bareiss's fraction-free elimination. This uses O(n^3)
+    ring operations, and each division is exact in an integral domain.
+    """
+    M = [row.copy() for row in entries]
+    n = len(M)
+    zero = M[0][0].ring.zero
+    negate = False
+    previous_pivot = None
+    for k in range(n - 1):
+        if M[k][k] == zero:
+            for i in range(k + 1, n):
+                if not M[i][k] == zero:
+                    M[k], M[i] = M[i], M[k]
+                    negate = not negate
+                    break
+            else:
+                return zero
+        pivot = M[k][k]
+        row_k = M[k]
+        for i in range(k + 1, n):
+            row_i = M[i]
+            for j in range(k + 1, n):
+                new_entry = row_i[j] * pivot - row_i[k] * row_k[j]
+                if previous_pivot is not None:
+                    new_entry = new_entry // previous_pivot
+                row_i[j] = new_entry
+        previous_pivot = pivot
+    if negate:
+        return -M[n - 1][n - 1]
+    return M[n - 1][n - 1]
+
+
+def _dot(u, v):
+    """Returns the sum of the products of the entries of `u` and `v`."""
+    total = u[0] * v[0]
+    for k in range(1, len(u)):
+        total = total + u[k] * v[k]
+    return total
+
+
+def _berkowitz_determinant(entries):
+    """
+    Returns the determinant of the square list-of-lists `entries`, with at
+    least two rows, by Berkowitz's algorithm. This builds the characteristic
+    polynomial of each leading principal submatrix from the previous one,
+    using O(n^4) ring operations and no division, so it works over any
+    commutative ring.
+    """
+    n = len(entries)
+    # Coefficients of det(xI - A_k) below the leading one, for the leading
+    # k by k submatrix A_k; for k = 1 this is x - a_00.
+    coefficients = [-entries[0][0]]
+    for k in range(1, n):
+        row = entries[k][:k]
+        vector = [entries[i][k] for i in range(k)]
+        # The first column of the Toeplitz matrix below its leading one:
+        # -a_kk, then -R C, -R A_k C, ..., -R A_k^(k-1) C.
+        column = [-entries[k][k]]
+        for m in range(k):
+            column.append(-_dot(row, vector))
+            if m < k - 1:
+                vector = [_dot(entries[i][:k], vector) for i in range(k)]
+        new_coefficients = []
+        for i in range(1, k + 2):
+            c = column[i - 1]
+            for j in range(1, min(i - 1, k) + 1):
+                c = c + column[i - j - 1] * coefficients[j - 1]
+            if i <= k:
+                c = c + coefficients[i - 1]
+            new_coefficients.append(c)
+        coefficients = new_coefficients
+    if n % 2 == 1:
+        return -coefficients[-1]
+    return coefficients[-1]
 
 
 class _MatrixGenericData:
@@ -27,112 +254,126 @@ class _MatrixGenericData:
     This class must be called with all arguments. It is assumed, but not
     checked, that the shape of `entries` conforms with this. In the case that
     `nrows==0` or `ncols==0`, one should have `entries=[]`.
+
+    Zero-filled matrices share a single zero element across all entries, so
+    additions and subtractions against them are detected by `_is_zero` and can
+    skip the entrywise loop.
     """
 
+    __slots__ = ("base_ring", "nrows", "ncols", "entries")
+
     def __init__(self, *, base_ring, nrows, ncols, entries):
         self.base_ring = base_ring
         self.nrows = nrows
         self.ncols = ncols
         self.entries = entries
 
+    @classmethod
+    def _from_raw(cls, base_ring, nrows, ncols, entries):
+        """
+        Returns an instance of `cls` wrapping `entries` as is. This skips the
+        keyword handling of `__init__` for results built inside this class,
+        whose entries are already ring elements of the right shape.
+        """
+        data = object.__new__(cls)
+        data.base_ring = base_ring
+        data.nrows = nrows
+        data.ncols = ncols
+        data.entries = entries
+        return data
+
+    def _is_zero(self):
+        """
+        Returns whether every entry is one shared zero element, as in the
+        matrices built zero-filled or by `x - x`. A zero matrix whose entries
+        are distinct objects is reported as nonzero. This stops at the first
+        entry that differs from the first one, so it is cheap on most inputs.
+        """
+        first = self.entries[0][0]
+        for row in self.entries:
+            for e in row:
+                if e is not first:
+                    return False
+        return first == first.ring.zero
+
     def det(self):
         """Alias for `determinant` method."""
         return self.determinant()
 
     def determinant(self):
-        if self.nrows != self.nrows:
+        if self.nrows != self.ncols:
             raise ValueError("Matrix must be square.")
         if self.nrows == 0:
             return self.base_ring(0)
         if self.nrows == 1:
             return self.entries[0][0]
-        entries = self.entries
-
-        def minor(array, i, j):
-            c = array
-            c = c[:i] + c[i + 1 :]
-            for k in range(0, len(c)):
-                c[k] = c[k][:j] + c[k][j + 1 :]
-            return c
-
-        def det(array, n):
-            if n == 1:
-                return array[0][0]
-            if n == 2:
-                return array[0][0] * array[1][1] - array[0][1] * array[1][0]
-            det = self.base_ring(base_ring=RR, ngens=3, prefix="x", packed=False)
-            det = det.zero
-            for i in range(0, n):
-                m = minor(array, 0, i)
-                det = det + RR((-1) ** i) * array[0][i] * det(m, n - 1)
-            return det
-
-        return det(entries, self.nrows)
+        if self.nrows == 2:
+            entries = self.entries
+            return entries[0][0] * entries[1][1] - entries[0][1] * entries[1][0]
+        # Fraction-free elimination needs exact division in an integral
+        # domain; otherwise fall back to Berkowitz's division-free algorithm.
+        if isinstance(self.entries[0][0].data, _BAREISS_DATA_TYPES):
+            return _bareiss_determinant(self.entries)
+        return _berkowitz_determinant(self.entries)
 
     def transpose(self):
         """Returns copy of the transposed matrix data."""
-        entries = self.entries
-        new_entries = []
-        for i in range(self.ncols):
-            new_entries.append([])
-            for j in range(self.nrows):
-                new_entries[-1].append(entries[j][i])
-
-        return _MatrixGenericData(
-            base_ring=self.base_ring,
-            nrows=self.ncols,
-            ncols=self.nrows,
-            entries=new_entries,
+        return self._from_raw(
+            self.base_ring,
+            self.ncols,
+            self.nrows,
+            [list(column) for column in zip(*self.entries)],
         )
 
     def size(self):
         """Returns size of a matrix as a tuple (rows, cols)."""
         return (self.nrows, self.ncols)
 
+    def _copy_as(self, cls):
+        """Returns a copy of self as an instance of `cls`; entries are shared."""
+        return cls._from_raw(
+            self.base_ring,
+            self.nrows,
+            self.ncols,
+            [row.copy() for row in self.entries],
+        )
+
     def __add__(self, other):
         if self.nrows != other.nrows or self.ncols != other.ncols:
             raise ValueError(
                 f"Cannot add matrix of size {self.nrows}x{self.ncols} to matrix of size {other.nrows}x{other.ncols}."
             )
 
-        if self.nrows == 0 or other.nrows == 0:
+        if self.nrows == 0 or self.ncols == 0:
             return other.__class__(
                 base_ring=other.base_ring,
                 nrows=other.nrows,
                 ncols=other.ncols,
                 entries=[],
             )
-        new_entries = [self.entries[i].copy() for i in range(self.nrows)]
-        for i in range(self.nrows):
-            for j in range(self.ncols):
-                new_entries[i][j] += other.entries[i][j]
-
-        return other.__class__(
-            base_ring=other.base_ring,
-            nrows=other.nrows,
-            ncols=other.ncols,
-            entries=new_entries,
-        )
+        if other._is_zero():
+            return self._copy_as(other.__class__)
+        if self._is_zero():
+            return other._copy_as(other.__class__)
 
-    def __mul__(self, other):
-        if (
-            str(type(other)) == "<class 'jacamar.rings.reals.RealNumber'>"
-            or str(type(other)) == "<class 'jacamar.rings.complexes.ComplexNumber'>"
-            or str(type(other)) == "<class 'jacamar.rings.integers.Integer'>"
-            or str(type(other)) == "<class 'jacamar.rings.rationals.Rational'>"
-        ):
-            new_entries = []
-            for i in self.entries:
-                new_entries.append([])
-                for j in i:
-                    new_entries[-1].append(other * j)
+        new_entries = [
+            [a + b for a, b in zip(row, other_row)]
+            for row, other_row in zip(self.entries, other.entries)
+        ]
 
-            return self.__class__(
-                base_ring=self.base_ring,
-                nrows=self.nrows,
-                ncols=self.ncols,
-                entries=new_entries,
+        return other._from_raw(other.base_ring, other.nrows, other.ncols, new_entries)
+
+    def __mul__(self, other):
+        if isinstance(other, _SCALAR_TYPES):
+            return self._from_raw(
+                self.base_ring,
+                self.nrows,
+                self.ncols,
+                [[other * e for e in row] for row in self.entries],
             )
+        return self.__matmul__(other)
+
+    def __matmul__(self, other):
         if self.ncols != other.nrows:
             raise ValueError(
                 f"Cannot multiply matrix of size {self.nrows}x{self.ncols} with matrix of size {other.nrows}x{other.ncols}."
@@ -148,125 +389,39 @@ class _MatrixGenericData:
             )
 
         # STRASSEN
-        elif (
-            self.ncols % 2 == 0
-            and self.nrows % 2 == 0
-            and other.ncols % 2 == 0
-            and other.nrows % 2 == 0
-            and self.size() == other.size()
-            and self.size()[0] > MATRIX_SWITCH
-        ):
-
-            def strassen(A, B):
-                n = len(A.entries)
-                if n <= 2:  # Base case
-                    return B.__class__(
-                        base_ring=B.base_ring,
-                        nrows=n,
-                        ncols=n,
-                        entries=np.dot(A.entries, B.entries),
-                    )
-
-                # Partitions
-                mid = n // 2
-                A11 = A[:mid, :mid]
-                A12 = A[:mid, mid:]
-                A21 = A[mid:, :mid]
-                A22 = A[mid:, mid:]
-                B11 = B[:mid, :mid]
-                B12 = B[:mid, mid:]
-                B21 = B[mid:, :mid]
-                B22 = B[mid:, mid:]
-                # Recursions
-                P1 = strassen(A11, B12 - B22)
-                P2 = strassen(A11 + A12, B22)
-                P3 = strassen(A21 + A22, B11)
-                P4 = strassen(A22, B21 - B11)
-                P5 = strassen(A11 + A22, B11 + B22)
-                P6 = strassen(A12 - A22, B21 + B22)
-                P7 = strassen(A11 - A21, B11 + B12)
-
-                # Combine results to form C
-                C11 = (P5 + P4 - P2 + P6).entries
-                C12 = (P1 + P2).entries
-                C21 = (P3 + P4).entries
-                C22 = (P5 + P1 - P3 - P7).entries
-
-                C1 = np.hstack((np.array(C11), np.array(C12)))
-                C2 = np.hstack((np.array(C21), np.array(C22)))
-                C = np.vstack((C1, C2)).tolist()
-
-                # Combine quadrants to form C
-                return _MatrixGenericData(
-                    base_ring=A.base_ring, nrows=len(C), ncols=len(C[0]), entries=C
-                )
-
-            # Set up parallelization
-            mid = self.nrows // 2
-            A11 = self[:mid, :mid]
-            A12 = self[:mid, mid:]
-            A21 = self[mid:, :mid]
-            A22 = self[mid:, mid:]
-            B11 = other[:mid, :mid]
-            B12 = other[:mid, mid:]
-            B21 = other[mid:, :mid]
-            B22 = other[mid:, mid:]
-            # Recursions (parallel)
-
-            sub_strassen = [
-                strassen(A11, B12 - B22),
-                strassen(A11 + A12, B22),
-                strassen(A21 + A22, B11),
-                strassen(A22, B21 - B11),
-                strassen(A11 + A22, B11 + B22),
-                strassen(A12 - A22, B21 + B22),
-                strassen(A11 - A21, B11 + B12),
-            ]
-
-            P1 = sub_strassen[0]
-            P2 = sub_strassen[1]
-            P3 = sub_strassen[2]
-            P4 = sub_strassen[3]
-            P5 = sub_strassen[4]
-            P6 = sub_strassen[5]
-            P7 = sub_strassen[6]
-
-            # Combine results to form C
-            C11 = (P5 + P4 - P2 + P6).entries
-            C12 = (P1 + P2).entries
-            C21 = (P3 + P4).entries
-            C22 = (P5 + P1 - P3 - P7).entries
-
-            C1 = np.hstack((np.array(C11), np.array(C12)))
-            C2 = np.hstack((np.array(C21), np.array(C22)))
-            C = np.vstack((C1, C2)).tolist()
-
-            # Combine quadrants to form C
-            return _MatrixGenericData(
-                base_ring=other.base_ring, nrows=len(C), ncols=len(C[0]), entries=C
-            )
+        elif self.nrows == self.ncols == other.ncols > MATRIX_SWITCH:
+            # Convert once and recurse on object arrays; only the final
+            # product is wrapped back into _MatrixGenericData.
+            new_entries = _strassen(
+                np.array(self.entries, dtype=object),
+                np.array(other.entries, dtype=object),
+            ).tolist()
+
+        # NumPy's product of object arrays runs the same ring operations as
+        # the loop below, but without interpreting the loop itself.
+        elif self.nrows * self.ncols * other.ncols > MATRIX_NUMPY_SWITCH:
+            new_entries = (
+                np.array(self.entries, dtype=object)
+                @ np.array(other.entries, dtype=object)
+            ).tolist()
 
         # standard matrix multiplication
         else:
-            se = self.entries
-            oe = other.entries
-            sr = self.nrows
-            on = other.ncols
+            # Walk the columns of other as rows of its transpose, so that the
+            # inner loop reads both operands sequentially.
+            other_columns = list(zip(*other.entries))
+            n = self.ncols
             new_entries = []
-            for i in range(sr):
-                new_entries.append([])
-                for j in range(on):
-                    new_entry = se[i][0] * oe[0][j]
-                    for k in range(1, self.ncols):
-                        new_entry += se[i][k] * oe[k][j]
-                    new_entries[i].append(new_entry)
-
-        return other.__class__(
-            base_ring=other.base_ring,
-            nrows=self.nrows,
-            ncols=other.ncols,
-            entries=new_entries,
-        )
+            for row in self.entries:
+                new_row = []
+                for column in other_columns:
+                    new_entry = row[0] * column[0]
+                    for k in range(1, n):
+                        new_entry += row[k] * column[k]
+                    new_row.append(new_entry)
+                new_entries.append(new_row)
+
+        return other._from_raw(other.base_ring, self.nrows, other.ncols, new_entries)
 
     def __sub__(self, other):
         if self.nrows != other.nrows or self.ncols != other.ncols:
@@ -274,25 +429,30 @@ class _MatrixGenericData:
                 f"Cannot add matrix of size {self.nrows}x{self.ncols} to matrix of size {other.nrows}x{other.ncols}."
             )
 
-        if self.nrows == 0 or other.nrows == 0:
+        if self.nrows == 0 or self.ncols == 0:
             return other.__class__(
                 base_ring=other.base_ring,
                 nrows=other.nrows,
                 ncols=other.ncols,
                 entries=[],
             )
+        if other._is_zero():
+            return self._copy_as(other.__class__)
+        if self is other:
+            zero = self.entries[0][0] - self.entries[0][0]
+            return other._from_raw(
+                other.base_ring,
+                other.nrows,
+                other.ncols,
+                [[zero] * other.ncols for _ in range(other.nrows)],
+            )
 
-        new_entries = [self.entries[i].copy() for i in range(self.nrows)]
-        for i in range(self.nrows):
-            for j in range(self.ncols):
-                new_entries[i][j] -= other.entries[i][j]
+        new_entries = [
+            [a - b for a, b in zip(row, other_row)]
+            for row, other_row in zip(self.entries, other.entries)
+        ]
 
-        return other.__class__(
-            base_ring=other.base_ring,
-            nrows=other.nrows,
-            ncols=other.ncols,
-            entries=new_entries,
-        )
+        return other._from_raw(other.base_ring, other.nrows, other.ncols, new_entries)
 
     def __str__(self):
         return str(self.entries)
@@ -301,6 +461,10 @@ class _MatrixGenericData:
         return self.__str__()
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, _MatrixGenericData):
+            return NotImplemented
         if self.nrows != other.nrows or self.ncols != other.ncols:
             return False
         if self.nrows == 0 or self.ncols == 0:
@@ -315,40 +479,20 @@ class _MatrixGenericData:
 
     def __getitem__(self, args):
         """
-        If i=args[0] and j=args[1], returns the jth entry of the ith row.
+        If i=args[0] and j=args[1], returns the jth entry of the ith row. If
+        either index is a slice, returns the corresponding submatrix.
         """
-        for idx in args:
-            if isinstance(idx, slice):
-                # Parse with submatrix.
-                r, c = args
-                entries = self.entries
-                new_entries = entries[r]
-                new_data = []
-
-                if not isinstance(new_entries[0], list):
-                    new_data = [new_entries[c]]
-                    if not isinstance(new_data[0], list):
-                        new_data = [new_data]
-                else:
-                    for i in new_entries:
-                        if not isinstance(i[c], list):
-                            new_data.append([i[c]])
-                        else:
-                            new_data.append(i[c])
+        r, c = args
+        if not isinstance(r, slice) and not isinstance(c, slice):
+            return self.entries[r][c]
 
-                ncols = len(new_data[0])
-                nrows = len(new_data)
-                if nrows == 1 and ncols == 1:
-                    return entries[0][0]
-
-                return self.__class__(
-                    base_ring=self.base_ring,
-                    nrows=nrows,
-                    ncols=ncols,
-                    entries=new_data,
-                )
+        r, c, nrows, ncols = _slice(r, c, self.nrows, self.ncols)
+        if nrows == 0 or ncols == 0:
+            new_entries = []
+        else:
+            new_entries = [row[c] for row in self.entries[r]]
 
-        return self.entries[args[0]][args[1]]
+        return self._from_raw(self.base_ring, nrows, ncols, new_entries)
 
     def __setitem__(self, args, val):
         """
@@ -358,6 +502,8 @@ class _MatrixGenericData:
 
 
 class _MatrixPythonData:
+    __slots__ = ("base_ring", "shape", "entries")
+
     def __init__(self, *, base_ring, shape, entries):
         self.base_ring = base_ring
         self.shape = shape
@@ -370,8 +516,17 @@ class Matrix:
     Numerical matrices are built off of flint mat objects
     while generic (polynomial) matrices use the
     _MatrixGenericData format.
+
+    Matrices over ZZ_py and RR_py are NumPy arrays of dtype `dtype`, which
+    defaults to the `numpy_dtype` of the base ring. If neither is set, NumPy
+    infers the dtype from the entries, so that for instance integers too large
+    for int64 are kept in an object array. A narrower dtype such as
+    `np.float32` halves the memory traffic of products and determinants at
+    the cost of precision; results keep the dtype of their arguments.
     """
 
+    __slots__ = ("base_ring", "_is_generic", "_is_python", "nrows", "ncols", "data")
+
     def __init__(
         self,
         *,
@@ -380,18 +535,15 @@ class Matrix:
         ncols=None,
         entries=None,
         data=None,
+        dtype=None,
     ):
 
         self.base_ring = base_ring
-        if self.base_ring in {ZZ, QQ, RR, CC, RR_py, ZZ_py}:
-            self._is_generic = False
-            self._is_python = False
-
-            if self.base_ring in {RR_py, ZZ_py}:
-                self._is_python = True
-        else:
-            self._is_generic = True
-            self._is_python = False
+        kind = _RING_KIND.get(base_ring, "generic")
+        self._is_generic = kind == "generic"
+        self._is_python = kind == "python"
+        if self._is_python and dtype is None:
+            dtype = base_ring.numpy_dtype
 
         # If data is provided, there is a fast constructor.
         if data is not None:
@@ -414,18 +566,10 @@ class Matrix:
             self.nrows = nrows
             self.ncols = ncols
 
-            if self.base_ring == ZZ:
-                self.data = flint.fmpz_mat(self.nrows, self.ncols)
-            elif self.base_ring == QQ:
-                self.data = flint.fmpq_mat(self.nrows, self.ncols)
-            elif self.base_ring == RR:
-                self.data = flint.arb_mat(self.nrows, self.ncols)
-            elif self.base_ring == CC:
-                self.data = flint.acb_mat(self.nrows, self.ncols)
-            elif self.base_ring == ZZ_py:
-                self.data = np.ndarray([self.nrows, self.ncols])
-            elif self.base_ring == RR_py:
-                self.data = np.ndarray([self.nrows, self.ncols])
+            if self._is_python:
+                self.data = np.ndarray([self.nrows, self.ncols], dtype=dtype)
+            elif not self._is_generic:
+                self.data = _MAT_CONSTRUCTORS[self.base_ring](self.nrows, self.ncols)
             else:
                 self.data = _MatrixGenericData(
                     base_ring=self.base_ring,
@@ -440,7 +584,7 @@ class Matrix:
             if entries is None:
                 self.nrows = nrows
                 self.ncols = ncols
-                new_entries = self._zero_entries()
+                new_entries = self._zero_entries(dtype)
             else:
                 if isinstance(entries, dict):
                     if nrows is None or ncols is None:
@@ -449,14 +593,25 @@ class Matrix:
                         )
                     self.nrows = nrows
                     self.ncols = ncols
-                    new_entries = self._zero_entries()
+                    new_entries = self._zero_entries(dtype)
                     # COERCE the given entries into the base ring, or it's data
                     # class in the non-generic case.
                     for t, e in entries.items():
                         if self._is_generic:
                             new_entries[t[0]][t[1]] = base_ring(e)
-                        else:
+                        elif self._is_python:
                             new_entries[t[0]][t[1]] = base_ring(e).data
+                        else:
+                            # Flatten only after bounds checking, so that a bad
+                            # key cannot land in another row.
+                            k = _index(t[0], self.nrows) * self.ncols + _index(
+                                t[1], self.ncols
+                            )
+                            # FLINT converts Python ints itself.
+                            if type(e) is int:
+                                new_entries[k] = e
+                            else:
+                                new_entries[k] = base_ring(e).data
 
                 # Else, assume that it is a list of lists of base_ring elements.
                 else:
@@ -467,39 +622,35 @@ class Matrix:
                         self.ncols = len(entries[0])
                     # Now, COERCE the given entries into the base_ring.
                     if self._is_generic:
-                        new_entries = []
-                        for i in range(self.nrows):
-                            new_entries.append([])
-                            for j in range(self.ncols):
-                                new_entries[i].append(self.base_ring(entries[i][j]))
+                        new_entries = [
+                            [self.base_ring(e) for e in row] for row in entries
+                        ]
                     # Unless, the base_ring is special, in which case we use
-                    # the underlying data to later construct a FLINT matrix.
+                    # the underlying data to later construct a NumPy array or,
+                    # from a flat row-major list, a FLINT matrix.
+                    #
+                    # TODO: fix the coercion here. If the input entries happen
+                    # to already be NUTHATCH classes wrapping FLINT classes,
+                    # then the following code does not work!
+                    elif self._is_python:
+                        new_entries = [
+                            [self.base_ring(e).data for e in row] for row in entries
+                        ]
+                    # FLINT converts Python ints itself, so only other
+                    # entries are passed through the base ring.
                     else:
-                        new_entries = []
-                        for i in range(self.nrows):
-                            new_entries.append([])
-                            for j in range(self.ncols):
-                                # TODO: fix the coercion here. If the input
-                                # entries happen to already be NUTHATCH
-                                # classes wrapping FLINT classes, then the
-                                # following code does not work!
-                                new_entries[i].append(
-                                    self.base_ring(entries[i][j]).data
-                                )
-
-            if self.base_ring == ZZ:
-                self.data = flint.fmpz_mat(new_entries)
-            elif self.base_ring == QQ:
-                self.data = flint.fmpq_mat(new_entries)
-            elif self.base_ring == RR:
-                self.data = flint.arb_mat(new_entries)
-            elif self.base_ring == CC:
-                self.data = flint.acb_mat(new_entries)
-            elif self.base_ring == ZZ_py:
-                self.data = np.array(new_entries)
-            elif self.base_ring == RR_py:
-                self.data = np.array(new_entries)
+                        new_entries = [
+                            e if type(e) is int else self.base_ring(e).data
+                            for row in entries
+                            for e in row
+                        ]
 
+            if self._is_python:
+                self.data = np.asarray(new_entries, dtype=dtype)
+            elif not self._is_generic:
+                self.data = _MAT_CONSTRUCTORS[self.base_ring](
+                    self.nrows, self.ncols, new_entries
+                )
             else:
                 self.data = _MatrixGenericData(
                     base_ring=self.base_ring,
@@ -509,17 +660,21 @@ class Matrix:
                 )
 
     # Constructor helper function.
-    def _zero_entries(self):
-        entries = []
-        for i in range(self.nrows):
-            i_row = []
-            for j in range(self.ncols):
-                if self._is_generic:
-                    i_row.append(self.base_ring(0))
-                else:
-                    i_row.append(self.base_ring(0).data)
-            entries.append(i_row)
-        return entries
+    def _zero_entries(self, dtype=None):
+        # NumPy-backed rings get a single zero-filled array when the dtype is
+        # known; otherwise NumPy infers it from the entries later.
+        if self._is_python:
+            if dtype is not None:
+                return np.zeros((self.nrows, self.ncols), dtype=dtype)
+            zero = self.base_ring(0).data
+            return [[zero] * self.ncols for _ in range(self.nrows)]
+        # FLINT matrices are built from a flat row-major list.
+        if not self._is_generic:
+            return [self.base_ring(0).data] * (self.nrows * self.ncols)
+        # Ring elements are immutable, so every cell can share one zero; only
+        # the rows must be distinct lists.
+        zero = self.base_ring(0)
+        return [[zero] * self.ncols for _ in range(self.nrows)]
 
     def det(self):
         """Alias for `determinenant` method."""
@@ -545,6 +700,13 @@ class Matrix:
 
     def transpose(self):
         """Returns a transposed copy of self."""
+        # NumPy's transpose is a strided view of the same memory; copy it
+        # into a new row-major array.
+        if self._is_python:
+            return Matrix(
+                base_ring=self.base_ring,
+                data=self.data.T.copy(),
+            )
         return Matrix(
             base_ring=self.base_ring,
             nrows=self.ncols,
@@ -552,31 +714,51 @@ class Matrix:
             data=self.data.transpose(),
         )
 
-    def __add__(self, other):
-        """Returns self + other with base ring that of other."""
-        return other.__class__(
-            base_ring=other.base_ring,
-            data=self.data + other.data,
+    def _compatible(self, other):
+        """
+        Returns whether `other` is a matrix stored the same way as self: both
+        generic, both NumPy-backed, or both FLINT-backed. FLINT matrices over
+        different rings are compatible, and FLINT coerces between them.
+        """
+        return (
+            isinstance(other, Matrix)
+            and self._is_generic == other._is_generic
+            and self._is_python == other._is_python
         )
 
+    def _operands(self, other):
+        """
+        Returns the base ring of a result combining self with other, followed
+        by the data of self and other. FLINT matrices are promoted to the later
+        of the two rings in ZZ, QQ, RR, CC; otherwise the ring is that of other.
+        """
+        if self._is_generic or self._is_python:
+            return other.base_ring, self.data, other.data
+        ring = max(self.base_ring, other.base_ring, key=_FLINT_RINGS.index)
+        a, b = self.data, other.data
+        if self.base_ring != ring:
+            a = _MAT_CONSTRUCTORS[ring](a)
+        if other.base_ring != ring:
+            b = _MAT_CONSTRUCTORS[ring](b)
+        return ring, a, b
+
+    def __add__(self, other):
+        """Returns self + other with base ring that of other, up to promotion."""
+        if not self._compatible(other):
+            return NotImplemented
+        ring, a, b = self._operands(other)
+        return other.__class__(base_ring=ring, data=a + b)
+
     def __sub__(self, other):
-        """Returns self - other with base ring that of other."""
-        return other.__class__(
-            base_ring=other.base_ring,
-            data=self.data - other.data,
-        )
+        """Returns self - other with base ring that of other, up to promotion."""
+        if not self._compatible(other):
+            return NotImplemented
+        ring, a, b = self._operands(other)
+        return other.__class__(base_ring=ring, data=a - b)
 
     def __mul__(self, other):
-        if (
-            str(type(other)) == "<class 'jacamar.rings.reals.RealNumber'>"
-            or str(type(other)) == "<class 'jacamar.rings.complexes.ComplexNumber'>"
-            or str(type(other)) == "<class 'jacamar.rings.integers.Integer'>"
-            or str(type(other)) == "<class 'jacamar.rings.rationals.Rational'>"
-        ):
-            if (
-                str(self.base_ring)
-                == "<class 'jacamar.rings.polynomials.PolynomialRing'>"
-            ):
+        if isinstance(other, _SCALAR_TYPES):
+            if self._is_generic:
                 return self.__class__(
                     base_ring=self.base_ring,
                     nrows=self.nrows,
@@ -590,23 +772,36 @@ class Matrix:
                 ncols=self.ncols,
                 data=self.data * other.data,
             )
+        return self.__matmul__(other)
 
+    def __matmul__(self, other):
+        """
+        Returns the matrix product self @ other with base ring that of other,
+        up to promotion.
+        """
+        if not self._compatible(other):
+            return NotImplemented
         if self.ncols != other.nrows:
             raise ValueError(
                 f"Cannot multiply matrix of size {self.nrows}x{self.ncols} with matrix of size {other.nrows}x{other.ncols}."
             )
 
+        ring, a, b = self._operands(other)
         if self.nrows == 0 or other.nrows == 0 or other.ncols == 0:
             return other.__class__(
-                base_ring=other.base_ring,
+                base_ring=ring,
                 nrows=self.nrows,
                 ncols=other.ncols,
             )
 
-        return other.__class__(
-            base_ring=other.base_ring,
-            data=self.data * other.data,
-        )
+        # FLINT and NumPy matrices are multiplied by their own C kernels;
+        # only truly generic rings go through _MatrixGenericData.
+        if self._is_generic or self._is_python:
+            data = a @ b
+        else:
+            data = a * b
+
+        return other.__class__(base_ring=ring, data=data)
 
     def __str__(self):
         return self.data.__str__()
@@ -615,8 +810,10 @@ class Matrix:
         return self.data.__repr__()
 
     def __eq__(self, other):
+        if self.nrows != other.nrows or self.ncols != other.ncols:
+            return False
         if self._is_python and other._is_python:
-            return self.data.all() == other.data.all()
+            return np.array_equal(self.data, other.data)
         return self.data == other.data
 
     def __call__(self, i, j):
@@ -626,60 +823,31 @@ class Matrix:
         raise NotImplementedError
 
     def __getitem__(self, args):
-        for idx in args:
-            if isinstance(idx, slice):
-                if not isinstance(args, tuple):
-                    return ValueError(
-                        "The matrix slice method takes 2 args [rows, columns], but 1 were given."
-                    )
-
-                elif len(args) == 2:
-                    r, c = args
-                    if not self._is_generic:
-                        r, c = args
-                        entries = self.data.tolist()
-                    else:
-                        entries = self.data.entries
-                    new_entries = entries[r]
-                    new_data = []
-
-                    if not isinstance(new_entries[0], list):
-                        new_data = [new_entries[c]]
-                        if not isinstance(new_data[0], list):
-                            new_data = [new_data]
-                    else:
-                        for i in new_entries:
-                            if not isinstance(i[c], list):
-                                new_data.append([i[c]])
-                            else:
-                                new_data.append(i[c])
-
-                    ncols = len(new_data[0])
-                    nrows = len(new_data)
-                    if not self._is_generic:
-                        r, c = args
-                        entries = self.data.tolist()
-                        return self.__class__(
-                            base_ring=self.base_ring,
-                            nrows=nrows,
-                            ncols=ncols,
-                            entries=new_data,
-                        )
-
-                    return self.__class__(
-                        base_ring=self.base_ring,
-                        nrows=nrows,
-                        ncols=ncols,
-                        entries=new_data,
-                        data=_MatrixGenericData(
-                            base_ring=self.base_ring,
-                            nrows=nrows,
-                            ncols=ncols,
-                            entries=new_data,
-                        ),
-                    )
-
-        return self.base_ring(self.data[args])
+        if not isinstance(args, tuple):
+            raise ValueError(
+                "The matrix slice method takes 2 args [rows, columns], but 1 were given."
+            )
+        r, c = args
+        if not isinstance(r, slice) and not isinstance(c, slice):
+            return self.base_ring(self.data[args])
+        if self._is_generic:
+            return self.__class__(base_ring=self.base_ring, data=self.data[args])
+
+        # Only the requested block is copied out of the data.
+        r, c, nrows, ncols = _slice(r, c, self.nrows, self.ncols)
+        if self._is_python:
+            return self.__class__(
+                base_ring=self.base_ring,
+                data=self.data[r, c].copy(),
+            )
+        rows = range(*r.indices(self.nrows))
+        cols = range(*c.indices(self.ncols))
+        return self.__class__(
+            base_ring=self.base_ring,
+            data=_MAT_CONSTRUCTORS[self.base_ring](
+                nrows, ncols, [self.data[i, j] for i in rows for j in cols]
+            ),
+        )
 
     def __setitem__(self, args, val):
         self.data[args] = val
@@ -692,23 +860,27 @@ def generate(value, nrows, ncols):
     """
     Generates a repeating matrix of size (rows, cols). Can be generic or not.
     """
-    entries = []
-    for i in range(nrows):
-        entries.append([])
-        for j in range(ncols):
-            entries[-1].append(value)
+    base_ring = value.ring
+    # Generic entries are immutable ring elements, so one coerced value can
+    # fill every cell; only the rows must be distinct lists.
+    if _RING_KIND.get(base_ring, "generic") == "generic":
+        value = base_ring(value)
+        if nrows == 0 or ncols == 0:
+            entries = []
+        else:
+            entries = [[value] * ncols for _ in range(nrows)]
+        return Matrix(
+            base_ring=base_ring,
+            data=_MatrixGenericData._from_raw(base_ring, nrows, ncols, entries),
+        )
+
+    entries = [[value] * ncols for _ in range(nrows)]
 
     return Matrix(
-        base_ring=value.ring,
+        base_ring=base_ring,
         nrows=nrows,
         ncols=ncols,
         entries=entries,
-        data=_MatrixGenericData(
-            base_ring=value.ring,
-            nrows=nrows,
-            ncols=ncols,
-            entries=entries,
-        ),
     )
 
 
@@ -722,27 +894,26 @@ def random(base_ring, max_val, nrows, ncols, poly=0, poly_ring=0, ngens=1):
 
     if poly:
         p = poly_ring(base_ring=base_ring, ngens=ngens, prefix="x", packed=True)
-        for i in range(nrows):
+        # Draw every coefficient and exponent at once; the loops below only
+        # assemble the polynomials.
+        coefficients = np.random.random((nrows, ncols, ngens)) * max_val
+        exponents = (np.random.random((nrows, ncols, ngens)) * max_val).astype(int)
+        if base_ring == ZZ:
+            coefficients = coefficients.astype(int)
+        gens = p.gens
+        for row_coefficients, row_exponents in zip(
+            coefficients.tolist(), exponents.tolist()
+        ):
             entries.append([])
-            for j in range(ncols):
+            for cs, es in zip(row_coefficients, row_exponents):
                 val = p(0)
-                for k in range(ngens):
-                    if base_ring == RR:
-                        val = val + base_ring(np.random.random() * max_val) * p.gens[
-                            k
-                        ] ** ZZ(int(np.random.random() * max_val))
-                    elif base_ring == ZZ:
-                        val = val + base_ring(
-                            int(np.random.random() * max_val)
-                        ) * p.gens[k] ** ZZ(int(np.random.random() * max_val))
-
+                if base_ring in {RR, ZZ}:
+                    for k in range(ngens):
+                        val = val + base_ring(cs[k]) * gens[k] ** ZZ(es[k])
                 entries[-1].append(val)
 
         return Matrix(
             base_ring=poly_ring,
-            nrows=nrows,
-            ncols=ncols,
-            entries=entries,
             data=_MatrixGenericData(
                 base_ring=poly_ring,
                 nrows=nrows,
@@ -750,42 +921,16 @@ def random(base_ring, max_val, nrows, ncols, poly=0, poly_ring=0, ngens=1):
                 entries=entries,
             ),
         )
-    if base_ring == RR:
-        vals = np.random.random(nrows * ncols) * max_val
-        for i in range(nrows):
-            entries.append([])
-            for j in range(ncols):
-                entries[-1].append(base_ring(vals[(i + 1) * (j)]))
-
-    elif base_ring == ZZ:
-        vals = np.random.randint(max_val, size=nrows * ncols)
-        for i in range(nrows):
-            entries.append([])
-            for j in range(ncols):
-                entries[-1].append(base_ring(int(vals[(i + 1) * (j)])))
-
-    elif base_ring == RR_py:
-        vals = np.random.random(nrows * ncols) * max_val
-        for i in range(nrows):
-            entries.append([])
-            for j in range(ncols):
-                entries[-1].append(vals[(i + 1) * (j)])
-
-        return Matrix(
-            base_ring=base_ring,
-            entries=entries,
-        )
-    elif base_ring == ZZ_py:
-        vals = np.random.randint(max_val, size=nrows * ncols)
-        for i in range(nrows):
-            entries.append([])
-            for j in range(ncols):
-                entries[-1].append(int(vals[(i + 1) * (j)]))
-
-        return Matrix(
-            base_ring=base_ring,
-            entries=entries,
-        )
+    if base_ring in {RR, RR_py}:
+        vals = np.random.random((nrows, ncols)) * max_val
+    elif base_ring in {ZZ, ZZ_py}:
+        vals = np.random.randint(max_val, size=(nrows, ncols))
+
+    # NumPy-backed rings store the sampled array as is.
+    if base_ring in {RR_py, ZZ_py}:
+        return Matrix(base_ring=base_ring, data=vals)
+    if base_ring in {RR, ZZ}:
+        entries = vals.tolist()
 
     return Matrix(
         base_ring=base_ring,
@@ -12,8 +12,16 @@ from jacamar.rings.integers import ZZ, ZZ_py
 from jacamar.rings.rationals import QQ
 from jacamar.rings.reals import RR, RR_py
 from jacamar.rings.complexes import CC
+from jacamar.rings.intmod import IntegerModNRing
 from jacamar.rings.polynomials import PolynomialRing
-from jacamar.matrices.matrices import Matrix, _MatrixGenericData, generate, random
+from jacamar.matrices.matrices import (
+    Matrix,
+    _MatrixGenericData,
+    _partition,
+    _strassen,
+    generate,
+    random,
+)
 
 
 class TestMatrix:
@@ -37,6 +45,25 @@ class TestMatrix:
         assert self.m == Matrix(base_ring=ZZ, entries=[[ZZ(1), ZZ(2)], [ZZ(3), ZZ(4)]])
         assert self.m._is_generic == False
 
+    def test_zero_construction(self):
+        """Tests construction of zero matrices and from dictionaries."""
+        z = Matrix(base_ring=ZZ_py, nrows=2, ncols=3)
+        assert z.size() == (2, 3)
+        assert z.data.tolist() == [[0, 0, 0], [0, 0, 0]]
+        r = Matrix(base_ring=RR_py, nrows=2, ncols=2, entries={(0, 1): 2.5})
+        assert r.data.tolist() == [[0.0, 2.5], [0.0, 0.0]]
+        assert Matrix(base_ring=ZZ, nrows=2, ncols=2, entries={(1, 0): 3}) == Matrix(
+            base_ring=ZZ, entries=[[0, 0], [3, 0]]
+        )
+        for ring in (ZZ, ZZ_py):
+            assert Matrix(
+                base_ring=ring, nrows=2, ncols=2, entries={(0, -1): 5}
+            ) == Matrix(base_ring=ring, entries=[[0, 5], [0, 0]])
+            with pytest.raises(IndexError):
+                Matrix(base_ring=ring, nrows=2, ncols=2, entries={(0, 2): 5})
+            with pytest.raises(IndexError):
+                Matrix(base_ring=ring, nrows=2, ncols=2, entries={(-3, 0): 5})
+
     def test_classes(self):
         """Tests classes."""
         assert isinstance(self.m, Matrix)
@@ -44,6 +71,39 @@ class TestMatrix:
     def test_equality_among_the_classes(self):
         pass
 
+    def test_matmul(self):
+        """Tests the @ operator."""
+        assert self.m @ self.n == self.m * self.n
+        assert self.m_py @ self.n_py == self.m_py * self.n_py
+        with pytest.raises(ValueError):
+            self.n @ self.m
+
+    def test_python_dtype(self):
+        """Tests the dtype of NumPy-backed matrices."""
+        assert self.m_py.data.dtype == np.dtype(int)
+        a = Matrix(base_ring=RR_py, entries=[[1, 2], [3, 4]], dtype=np.float32)
+        b = Matrix(base_ring=RR_py, nrows=2, ncols=2, dtype=np.float32)
+        assert a.data.dtype == np.float32
+        assert b.data.dtype == np.float32
+        assert (a * a).data.dtype == np.float32
+        assert (a + b).data.dtype == np.float32
+        assert a * a == Matrix(base_ring=RR_py, entries=[[7, 10], [15, 22]])
+        z = Matrix(base_ring=ZZ_py, nrows=2, ncols=2)
+        assert z.data.dtype == np.dtype(int)
+        # Integers too large for int64 fall back to an object array.
+        big = Matrix(base_ring=ZZ_py, entries=[[2**70, 1], [1, 1]])
+        assert big.data.dtype == object
+        assert big[0, 0] == ZZ_py(2**70)
+        big = Matrix(base_ring=ZZ_py, nrows=2, ncols=2, entries={(0, 0): 2**70})
+        assert big[0, 0] == ZZ_py(2**70)
+
+    def test_python_equality(self):
+        """Tests __eq__ on NumPy-backed matrices compares every entry."""
+        assert self.m_py == Matrix(base_ring=ZZ_py, entries=[[1, 2], [3, 4]])
+        assert not self.m_py == Matrix(base_ring=ZZ_py, entries=[[1, 2], [3, 5]])
+        assert not self.m_py == self.n_py
+        assert not self.thin_py == self.flat_py
+
     def test_sizes(self):
         """Tests nrows and ncols."""
         assert self.m.nrows == 2
@@ -79,13 +139,42 @@ class TestMatrix:
             self.m + self.m_py
         with pytest.raises(TypeError):
             self.m_py + self.m
+        with pytest.raises(TypeError):
+            self.m + 1
+
+    def test_mixed_flint(self):
+        """Tests that FLINT matrices over different rings combine."""
+        q = Matrix(base_ring=QQ, entries=[[1, 2], [3, 4]])
+        r = Matrix(base_ring=RR, entries=[[1, 2], [3, 4]])
+        x = self.m * q
+        assert x.base_ring == QQ
+        assert x == Matrix(base_ring=QQ, entries=[[7, 10], [15, 22]])
+        y = self.m + r
+        assert y.base_ring == RR
+        assert y == Matrix(base_ring=RR, entries=[[2, 4], [6, 8]])
+        # The result is over the larger ring in either order.
+        for u, v, ring in (
+            (self.m, q, QQ),
+            (q, self.m, QQ),
+            (self.m, r, RR),
+            (r, self.m, RR),
+            (q, r, RR),
+            (r, q, RR),
+        ):
+            for w in (u * v, u + v, u - v):
+                assert w.base_ring == ring
+                assert w[0, 0] == ring(w.data[0, 0])
+        assert (q * self.m).base_ring == QQ
+        assert q * self.m == Matrix(base_ring=QQ, entries=[[7, 10], [15, 22]])
+        assert self.m + q == Matrix(base_ring=QQ, entries=[[2, 4], [6, 8]])
 
     def test_mul(self):
         """Tests __mul__."""
-        # x = self.m * self.n
-        # x_py = self.m_py * self.n_py
-        # assert x == Matrix(base_ring=ZZ, entries=[[9, 12, 15], [19, 26, 33]])
-        # assert x_py == Matrix(base_ring=ZZ_py, entries=[[9, 12, 15], [19, 26, 33]])
+        x = self.m * self.n
+        x_py = self.m_py * self.n_py
+        assert x == Matrix(base_ring=ZZ, entries=[[9, 12, 15], [19, 26, 33]])
+        assert x_py == Matrix(base_ring=ZZ_py, entries=[[9, 12, 15], [19, 26, 33]])
+        assert x_py.size() == (2, 3)
         s1 = 0
         s2 = 0
         s3 = 17
@@ -179,6 +268,10 @@ class TestMatrix:
         assert b[0, 0] == RR(5)
         assert a_py[1, 2] == RR_py(6)
         assert b_py[0, 0] == RR_py(5)
+        with pytest.raises(ValueError):
+            a[0]
+        with pytest.raises(ValueError):
+            a_py[0:2]
 
     def test_submatrix(self):
         """Tests __getitem__ with slices."""
@@ -195,6 +288,31 @@ class TestMatrix:
         assert a[:, 2] == c
         assert a[1, 0:2] == d
 
+        e = Matrix(base_ring=ZZ, entries=[[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        e_py = Matrix(base_ring=ZZ_py, entries=[[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        f = Matrix(base_ring=ZZ, entries=[[1, 3], [7, 9]])
+        f_py = Matrix(base_ring=ZZ_py, entries=[[1, 3], [7, 9]])
+        assert e[::2, ::2] == f
+        assert e_py[::2, ::2] == f_py
+        assert e[-1, 1:].size() == (1, 2)
+        assert e[0:0, :].size() == (0, 3)
+
+        # Submatrices do not share entries with the original.
+        g_py = e_py[:, :]
+        g_py[0, 0] = 10
+        assert e_py[0, 0] == ZZ_py(1)
+
+    def test_submatrix_out_of_range(self):
+        """Tests that __getitem__ rejects out of range integer indices."""
+        for a in (self.n, self.n_py):
+            assert a[-2, :].size() == (1, 3)
+            with pytest.raises(IndexError):
+                a[5, :]
+            with pytest.raises(IndexError):
+                a[-3, :]
+            with pytest.raises(IndexError):
+                a[:, 9]
+
     def test_size(self):
         """Tests .size()"""
         a = Matrix(base_ring=RR, entries=[[1, 2, 3], [4, 5, 6], [7, 8, 9]])
@@ -220,6 +338,17 @@ class TestMatrix:
         assert a_py.transpose() == b_py
         assert a.T() == b
 
+        # The transpose does not share entries with the original.
+        c_py = a_py.T()
+        assert c_py.data.flags["C_CONTIGUOUS"]
+        c_py[0, 1] = 10
+        assert a_py[1, 0] == RR_py(3)
+        v_py = Matrix(base_ring=ZZ_py, entries=[[1, 2, 3]])
+        w_py = v_py.T()
+        assert w_py.size() == (3, 1)
+        w_py[0, 0] = 99
+        assert v_py[0, 0] == ZZ_py(1)
+
     @pytest.mark.slow
     def test_np_construction(self):
         """Tests numpy construction for RR_py and ZZ_py."""
@@ -271,6 +400,71 @@ class TestGenericMatrices:
         assert f == ZZ(2) * self.x1 * self.x2 + ZZ(9) * self.x0 ** ZZ(4)
         assert a[1, 1] == f
 
+    def test_generic_submatrix(self):
+        """Tests slicing of generic matrix data."""
+        f = self.z({(1, 1, 2, 1): ZZ(2), (0, 4): ZZ(9)})
+        g = f * f
+        a = _MatrixGenericData(
+            base_ring=self.z, nrows=2, ncols=3, entries=[[f, g, f], [g, f, g]]
+        )
+        assert a[0, 1] == g
+        assert a[:, 1:].size() == (2, 2)
+        assert a[:, 1:].entries == [[g, f], [f, g]]
+        assert a[1, :].size() == (1, 3)
+        assert a[1, :].entries == [[g, f, g]]
+        assert a[:, -1].size() == (2, 1)
+        assert a[:, -1].entries == [[f], [g]]
+        assert a[1:, 0] == _MatrixGenericData(
+            base_ring=self.z, nrows=1, ncols=1, entries=[[g]]
+        )
+        assert a[2:, :].size() == (0, 3)
+
+        m = Matrix(base_ring=self.z, entries=[[f, g, f], [g, f, g]])
+        assert m[1, 1] == f
+        assert m[:, 1:] == Matrix(base_ring=self.z, entries=[[g, f], [f, g]])
+        assert m[0, :] == Matrix(base_ring=self.z, entries=[[f, g, f]])
+        assert m[1:, 0] == Matrix(base_ring=self.z, entries=[[g]])
+        assert m[2:, :].size() == (0, 3)
+        with pytest.raises(IndexError):
+            m[5, :]
+        with pytest.raises(IndexError):
+            m[:, -4]
+
+    def test_generic_scalar_mult(self):
+        """Tests multiplication of a generic matrix by a scalar."""
+        f = self.z({(1, 1, 2, 1): ZZ(2), (0, 4): ZZ(9)})
+        a = generate(f, 2, 3)
+        assert a * ZZ(3) == generate(ZZ(3) * f, 2, 3)
+        assert (a * ZZ(3)).size() == (2, 3)
+
+    def test_generic_transpose(self):
+        """Tests transpose of a generic matrix."""
+        f = self.z({(1, 1, 2, 1): ZZ(2), (0, 4): ZZ(9)})
+        g = f * f
+        a = Matrix(base_ring=self.z, entries=[[f, g, f], [g, g, f]])
+        b = Matrix(base_ring=self.z, entries=[[f, g], [g, g], [f, f]])
+        assert a.T() == b
+        assert a.T().size() == (3, 2)
+        assert Matrix(base_ring=self.z, nrows=0, ncols=2).T().size() == (2, 0)
+
+    def test_generic_matmul(self):
+        """Tests the @ operator on generic matrices."""
+        f = self.z({(1, 1, 2, 1): ZZ(2), (0, 4): ZZ(9)})
+        a = Matrix(base_ring=self.z, entries=[[f, f * f], [f, f]])
+        b = generate(f, 2, 3)
+        assert a @ b == a * b
+        assert (a @ b).size() == (2, 3)
+
+    def test_generic_eq(self):
+        """Tests __eq__ of generic matrix data."""
+        f = self.z({(1, 1, 2, 1): ZZ(2), (0, 4): ZZ(9)})
+        a = generate(f, 2, 2)
+        assert a.data == a.data
+        assert a.data == generate(f, 2, 2).data
+        assert not a.data == generate(f * f, 2, 2).data
+        assert not a.data == generate(f, 2, 3).data
+        assert not a.data == a.data.entries
+
     def test_generic_mult(self):
         """Tests __mul__ of a generic ZZ matrix."""
         f = self.z({(1, 1, 2, 1): ZZ(2), (0, 4): ZZ(9)})
@@ -318,6 +512,33 @@ class TestGenericMatrices:
         )
         assert a + a - a == a
 
+    def test_generic_zero_add_sub(self):
+        """Tests the zero-matrix fast paths of __add__ and __sub__."""
+        f = self.z({(1, 1, 2, 1): ZZ(2), (0, 4): ZZ(9)})
+        a = generate(f, 2, 2)
+        zero = Matrix(base_ring=self.z, nrows=2, ncols=2)
+        assert zero.data._is_zero()
+        assert a + zero == a
+        assert zero + a == a
+        assert a - zero == a
+        assert (a - zero).data.entries is not a.data.entries
+        assert (a.data - a.data)._is_zero()
+        assert a.data - a.data == zero.data
+        zero[0, 0] = f
+        assert not zero.data._is_zero()
+        assert zero + zero == Matrix(
+            base_ring=self.z, entries=[[f + f, self.z.zero], [self.z.zero] * 2]
+        )
+        # Entries mutated through the public list are seen as well.
+        x0, x1 = self.z.gens[:2]
+        zero = Matrix(base_ring=self.z, nrows=2, ncols=2)
+        zero.data.entries[0][0] = x0
+        assert not zero.data._is_zero()
+        assert (generate(x1, 2, 2) + zero)[0, 0] == x0 + x1
+        thin = Matrix(base_ring=self.z, nrows=3, ncols=0)
+        assert (thin + thin).data.entries == []
+        assert (thin - thin).data.entries == []
+
     @pytest.mark.slow
     def test_straussen_mult(self):
         """Tests __mul__ (strassen alogorithm) of a generic ZZ matrix."""
@@ -345,6 +566,43 @@ class TestGenericMatrices:
         # assert 1 == 0
         # assert mq * mq == generate(ZZ(s)*q*q, s, s)
 
+    def test_partition(self):
+        """Tests the block partition used by the Strassen kernel."""
+        a = np.arange(20).reshape(4, 5)
+        blocks = _partition(a, 2)
+        assert blocks[0][0].shape == (2, 2)
+        assert blocks[1][1].shape == (2, 3)
+        assert np.array_equal(np.block(blocks), a)
+        blocks[1][0][0, 0] = -1
+        assert a[2, 0] == -1
+
+    def test_strassen_kernel(self):
+        """Tests the Strassen kernel against the standard product."""
+        for s in (6, 7, 8, 11):
+            a = Matrix(
+                base_ring=self.z,
+                entries=[
+                    [
+                        self.z({(0, i + 1, 1, j + 1): ZZ(i + 2 * j + 1)})
+                        for j in range(s)
+                    ]
+                    for i in range(s)
+                ],
+            )
+            b = Matrix(
+                base_ring=self.z,
+                entries=[
+                    [self.z({(1, i + 1, 2, j + 1): ZZ(3 * i - j)}) for j in range(s)]
+                    for i in range(s)
+                ],
+            )
+            c = _strassen(
+                np.array(a.data.entries, dtype=object),
+                np.array(b.data.entries, dtype=object),
+                cutoff=2,
+            )
+            assert c.tolist() == (a * b).data.entries
+
     def test_kmb_mult(self):
         """Tests __mul__ (Kauers-Moosbauer alogorithm) of a generic ZZ matrix."""
         f = self.z({(1, 1, 2, 1): ZZ(2), (0, 4): ZZ(9)})
@@ -488,9 +746,64 @@ class TestGenericMatrices:
             f ** ZZ(2) - f ** ZZ(2)
         ) + f * (f ** ZZ(2) - f ** ZZ(2))
 
+    def test_generic_det_larger(self):
+        """Tests generic determinants by elimination and by Berkowitz."""
+        for ring in (self.z, self.s):
+            x0, x1, x2 = ring.gens
+            zero = ring.zero
+            f = x0 + x1 * x2
+            a = Matrix(
+                base_ring=ring, entries=[[x0, x1, x2], [x1, f, x0], [x2, x0, f]]
+            )
+            assert a.det() == x0 * (f * f - x0 * x0) - x1 * (
+                x1 * f - x0 * x2
+            ) + x2 * (x1 * x0 - f * x2)
+            b = Matrix(
+                base_ring=ring, entries=[[zero, x1, x2], [x1, zero, x0], [x2, x0, f]]
+            )
+            assert b.det() == -x1 * (x1 * f - x0 * x2) + x2 * x1 * x0
+            c = Matrix(
+                base_ring=ring,
+                entries=[[x0, x1, x2], [x0, x1, x2], [f, x0, x1]],
+            )
+            assert c.det() == zero
+            d = Matrix(
+                base_ring=ring,
+                entries=[
+                    [x0, zero, zero, zero],
+                    [x1, x1, zero, zero],
+                    [x2, f, x2, zero],
+                    [f, x0, x1, f],
+                ],
+            )
+            assert d.det() == x0 * x1 * x2 * f
+
+    def test_intmod_det(self):
+        """Tests generic determinants over integers modulo N."""
+        r = IntegerModNRing(7)
+        a = Matrix(base_ring=r, entries=[[1, 2, 3], [4, 5, 6], [7, 8, 10]])
+        assert a.det() == r(-3)
+        # Z/6 is not an integral domain, so this needs a division-free method.
+        s = IntegerModNRing(6)
+        b = Matrix(base_ring=s, entries=[[2, 1, 0], [0, 3, 1], [1, 0, 2]])
+        assert b.det() == s(13)
+        # Larger sizes stay polynomial time; compare with FLINT over ZZ.
+        values = np.random.default_rng(1).integers(0, 7, (19, 19)).tolist()
+        c = Matrix(base_ring=r, entries=values)
+        assert c.det() == r(int(Matrix(base_ring=ZZ, entries=values).det().data))
+
     def test_generate(self):
         """Tests generate fuinction, which creates a matrix of size (r, c) with a specific entry."""
         f = self.r({(1, 1, 2, 1): RR(2), (0, 4): RR(9)})
+        a = generate(f, 2, 3)
+        assert a.size() == (2, 3)
+        assert a[1, 2] == f
+        # Generic cells share one value, but the rows are distinct lists.
+        assert a.data.entries[0][0] is a.data.entries[1][2]
+        assert a.data.entries[0] is not a.data.entries[1]
+        assert generate(f, 0, 3).size() == (0, 3)
+        z = generate(ZZ(5), 3, 2)
+        assert z == Matrix(base_ring=ZZ, entries=[[5, 5], [5, 5], [5, 5]])
 
     def test_random(self):
         """Tests random matrix generation function."""
@@ -498,3 +811,6 @@ class TestGenericMatrices:
         a = random(RR, 10, 10, 10)
         b = random(RR, 2, 10, 10)
         assert a * b, f
+        for ring in (ZZ, ZZ_py, RR, RR_py):
+            m = random(ring, 10, 3, 4)
+            assert m.size() == (3, 4)
@@ -15,25 +15,16 @@ class ComplexNumber(AbstractRingElement):
     Base class for complex numbers, built on AbstractRingElement.
     """
 
+    __slots__ = ()
     data_class = flint.acb  # type: ignore
 
-    def __init__(self, *args):
-        if len(args) == 3:
-            ring, a, b = args
-            AbstractRingElement.__init__(self, ring, self.data_class(a, b))
+    def __init__(self, ring, data=0):
+        AbstractRingElement.__init__(self, ring, data)
 
-        elif len(args) == 2:
-            ring, a = args
-            AbstractRingElement.__init__(self, ring, self.data_class(a))
-
-        elif len(args) == 1:
-            ring = args[0]
-            AbstractRingElement.__init__(self, ring, 0)
-
-        else:
-            raise TypeError(
-                f"ComplexNumber() takes 1, 2, or 3 arguments, but {len(args)} were given."
-            )
+    @classmethod
+    def from_re_im(cls, ring, a, b):
+        """Returns the complex number a + bi in ring."""
+        return cls._from_data(ring, cls.data_class(a, b))
 
     def __truediv__(self, other):
         """Returns self / other with type that of self."""
@@ -61,8 +52,10 @@ class ComplexRing(AbstractRing):
         self.zero = self(0)
         self.one = self(1)
 
-    def __call__(self, *args):
-        return ComplexNumber(self, *args)
+    def __call__(self, a=0, b=None):
+        if b is None:
+            return ComplexNumber(self, a)
+        return ComplexNumber.from_re_im(self, a, b)
 
     def __str__(self):
         return "The ring of complex numbers (via flint.acb)."
@@ -11,33 +11,53 @@ AUTHORS:
 
 
 class AbstractRingElement:
+    __slots__ = ("ring", "data")
+
     def __init__(self, ring, data):
         self.ring = ring
+        element_class = ring.element_class
         # TODO: does this have unexpected copying behavior? It seems like if we
         # change .data in one place it will be changed elsewhere.
-        if isinstance(data, self.ring.element_class):
+        if isinstance(data, element_class):
             self.data = data.data
-        elif isinstance(data, self.ring.element_class.data_class):
+        elif isinstance(data, element_class.data_class):
             self.data = data
         else:
-            self.data = self.ring.element_class.data_class(data)
+            self.data = element_class.data_class(data)
+
+    @classmethod
+    def _from_data(cls, ring, data):
+        """
+        Builds an element directly from `data`, which must already be an
+        instance of `cls.data_class`. Skips the coercion done by `__init__`.
+        """
+        element = object.__new__(cls)
+        element.ring = ring
+        element.data = data
+        return element
 
     # Arithmetic functions.
     def __add__(self, other):
         """Returns self + other with type that of other."""
+        if type(self) is type(other):
+            return other._from_data(other.ring, self.data + other.data)
         return other.__class__(other.ring, self.data + other.data)
 
     def __mul__(self, other):
         """Returns self * other with type that of other."""
+        if type(self) is type(other):
+            return other._from_data(other.ring, self.data * other.data)
         return other.__class__(other.ring, self.data * other.data)
 
     def __sub__(self, other):
         """Returns self - other with type that of other."""
+        if type(self) is type(other):
+            return other._from_data(other.ring, self.data - other.data)
         return other.__class__(other.ring, self.data - other.data)
 
     def __neg__(self):
         """Returns - self."""
-        return self.__class__(self.ring, -self.data)
+        return self._from_data(self.ring, -self.data)
 
     def __truediv__(self, other):
         """Returns self / other with type that of self."""
@@ -83,3 +103,16 @@ class AbstractRingElement:
 
     def __ne__(self, other):
         return self.data != other.data
+
+
+class AbstractAlgebraElement(AbstractRingElement):
+    """
+    Base class for elements of a ring built over a ring of coefficients, which
+    is stored as `self.base_ring` next to the ambient ring `self.ring`.
+    """
+
+    @classmethod
+    def _from_data(cls, ring, data):
+        element = super()._from_data(ring, data)
+        element.base_ring = ring.base_ring
+        return element
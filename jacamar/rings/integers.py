@@ -13,6 +13,7 @@ from jacamar.rings.rings import AbstractRing
 
 
 class Integer(AbstractRingElement):
+    __slots__ = ()
     data_class = flint.fmpz
 
     def __init__(self, ring, n):
@@ -44,6 +45,7 @@ class Integer(AbstractRingElement):
 
 
 class IntegerPython(AbstractRingElement):
+    __slots__ = ()
     data_class = int
 
     def __init__(self, ring, n):
@@ -84,6 +86,9 @@ class IntegerRing(AbstractRing):
 class IntegerRingPython(AbstractRing):
     def __init__(self):
         AbstractRing.__init__(self, IntegerPython, exact=True)
+        # Matrices over this ring let NumPy infer their dtype, so that large
+        # integers fall back to object arrays instead of overflowing int64.
+        self.numpy_dtype = None
         self.one = self(1)
         self.zero = self(0)
 
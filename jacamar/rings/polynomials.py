@@ -25,7 +25,7 @@ import pyximport
 
 pyximport.install()
 import jacamar.rings.cpoly as cpoly
-from jacamar.rings.elements import AbstractRingElement
+from jacamar.rings.elements import AbstractAlgebraElement, AbstractRingElement
 from jacamar.rings.rings import AbstractRing
 from jacamar.rings.integers import ZZ
 from jacamar.rings.rationals import QQ
@@ -307,7 +307,7 @@ class PolynomialData:
         return x
 
 
-class Polynomial(AbstractRingElement):
+class Polynomial(AbstractAlgebraElement):
     """
     The ring of coefficients is `self.base_ring` while the ambient polynomial
     ring is `self.ring`.
@@ -422,7 +422,7 @@ class Polynomial(AbstractRingElement):
         return str(self)
 
 
-class SpecialPolynomial(AbstractRingElement):
+class SpecialPolynomial(AbstractAlgebraElement):
     """
     The ring of coefficients is `self.base_ring` while the ambient polynomial
     ring is `self.ring`.
@@ -13,6 +13,7 @@ from jacamar.rings.rings import AbstractRing
 
 
 class Rational(AbstractRingElement):
+    __slots__ = ()
     data_class = flint.fmpq
 
     def __init__(self, *args):
@@ -14,6 +14,7 @@ class RealNumber(AbstractRingElement):
     Base class for real numbers, built on AbstractRingElement.
     """
 
+    __slots__ = ()
     data_class = flint.arb  # type: ignore
 
     def is_unit(self):
@@ -61,6 +62,7 @@ class RealNumberPython(AbstractRingElement):
     Base class for real numbers, built on AbstractRingElement. Interfaces with python.
     """
 
+    __slots__ = ()
     data_class = float
 
     def is_unit(self):
@@ -109,6 +111,8 @@ class RealRingPython(AbstractRing):
 
     def __init__(self):
         AbstractRing.__init__(self, RealNumberPython, exact=False)
+        # The NumPy dtype of matrices over this ring, unless one is given.
+        self.numpy_dtype = float
         self.one = self(1)
         self.zero = self(0)
 
@@ -20,7 +20,7 @@ AUTHORS:
 
 import functools
 import itertools
-from jacamar.rings.elements import AbstractRingElement
+from jacamar.rings.elements import AbstractAlgebraElement, AbstractRingElement
 from jacamar.rings.integers import ZZ
 from jacamar.rings.rings import AbstractRing
 from jacamar.rings.polynomials import (
@@ -174,7 +174,7 @@ class SeriesData:
         return degree
 
 
-class Series(AbstractRingElement):
+class Series(AbstractAlgebraElement):
     data_class = SeriesData
 
     def __init__(self, ring, data):
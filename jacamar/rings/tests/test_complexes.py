@@ -8,6 +8,7 @@ import pytest
 import flint
 from jacamar.rings.complexes import (
     CC,
+    ComplexNumber,
     sin,
     cos,
     tan,
@@ -43,6 +44,12 @@ class TestComplexNumber:
         """Tests CC()."""
         assert CC() == CC(0)
 
+    def test_re_im(self):
+        """Tests CC(a, b) and ComplexNumber.from_re_im."""
+        assert CC(2, 3) == CC(2 + 3j)
+        assert ComplexNumber.from_re_im(CC, 2, 3) == CC(2 + 3j)
+        assert CC(CC(2 + 3j)) == CC(2 + 3j)
+
     def test_truediv(self):
         """Tests that x / y."""
         x = CC(1)
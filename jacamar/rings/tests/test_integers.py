@@ -30,6 +30,19 @@ class TestInteger:
         assert Integer.data_class == fmpz
         assert IntegerPython.data_class == int
 
+    def test_slots(self):
+        """Tests that integers carry no instance dictionary."""
+        assert not hasattr(ZZ(3), "__dict__")
+        assert not hasattr(ZZ_py(3), "__dict__")
+
+    def test_arithmetic_types(self):
+        """Tests that +, -, * and unary - keep the class and ring."""
+        for a, b in ((ZZ(3), ZZ(5)), (ZZ_py(3), ZZ_py(5))):
+            for c in (a + b, a - b, a * b, -a):
+                assert type(c) is type(a)
+                assert c.ring is a.ring
+                assert type(c.data) is a.data_class
+
     def test_equality_among_the_classes(self):
         """Tests that ZZ(n) == ZZ_py(n) == Integer(n) == Integer_py(n)."""
         with pytest.raises(AttributeError):
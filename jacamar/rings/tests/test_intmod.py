@@ -70,6 +70,14 @@ class TestIntegerModN:
         assert repr(r1(10)) == "10"
         assert repr(r1(27)) == "3"
 
+    def test_arithmetic_types(self):
+        """Tests that +, -, * and unary - keep the class and ring."""
+        a, b = r1(5), r1(21)
+        for c in (a + b, a - b, a * b, -a):
+            assert type(c) is IntegerModN
+            assert c.ring is r1
+            assert type(c.data) is nmod
+
     def test_add(self):
         """Tests that the addition operator works correctly."""
         assert r2(30) + r2(35) == r2(65)
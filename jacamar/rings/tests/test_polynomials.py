@@ -195,6 +195,14 @@ class TestPolynomialRing:
     x2 = r.gens[2]
     a = r(-5) + x0 + x1 + x2
 
+    def test_arithmetic_types(self):
+        """Tests that +, -, * and unary - keep the class and both rings."""
+        a, b = self.r(-5) + self.x0, self.x1 * self.x2
+        for c in (a + b, a - b, a * b, -a):
+            assert type(c) is type(a)
+            assert c.ring is self.r
+            assert c.base_ring is ZZ
+
     def test_special_poly(self):
         """Tests construction of QQ and ZZ special polynomials"""
         s = PolynomialRing(base_ring=ZZ, ngens=3, prefix="x")
@@ -297,6 +305,14 @@ class TestSpecialPolynomialRing:
 
     v = y0 + ZZ(4) * y1 ** ZZ(2) + y2 + y3 + y4
 
+    def test_arithmetic_types(self):
+        """Tests that +, -, * and unary - keep the class and both rings."""
+        a, b = self.a, self.b
+        for c in (a + b, a - b, a * b, -a):
+            assert type(c) is type(a)
+            assert c.ring is self.s
+            assert c.base_ring is ZZ
+
     def test_eval(self):
         """Tests evaluation at a point."""
         assert self.b(ZZ(1), ZZ(1), ZZ(1)) == ZZ(3)
@@ -46,6 +46,14 @@ class TestRealNumber:
         """Tests RR(c, r)"""
         assert RR("10.5+/-0.5") == RR("10.4 +/-0.5")
 
+    def test_arithmetic_types(self):
+        """Tests that +, -, * and unary - keep the class and ring."""
+        for a, b in ((RR(1.5), RR(2)), (RR_py(1.5), RR_py(2))):
+            for c in (a + b, a - b, a * b, -a):
+                assert type(c) is type(a)
+                assert c.ring is a.ring
+                assert type(c.data) is a.data_class
+
     def test_truediv(self):
         """Tests that x / y."""
         x = RR(1)
@@ -95,6 +95,14 @@ class TestSeries:
     s = PowerSeriesRing(base_ring=ZZ, ngens=4, prefix="x", precision_cap=5)
     x0, x1, x2, x3 = s.gens
 
+    def test_arithmetic_types(self):
+        """Tests that +, -, * and unary - keep the class and both rings."""
+        a, b = self.x0 + self.x1, self.x2
+        for c in (a + b, a - b, a * b, -a):
+            assert type(c) is Series
+            assert c.ring is self.s
+            assert c.base_ring is ZZ
+
     def test_mul(self):
         """Tests the __mul__ and __rmul__ methods."""
         assert (self.x0 + self.x1) ** ZZ(2) == self.x0 ** ZZ(2) + ZZ(